@@ -0,0 +1,197 @@
+import json
+import pickle
+
+import pytest
+
+import enterprise_dab_validator
+from enterprise_dab_validator import EnterpriseDabValidator
+
+JOB_YAML = """\
+resources:
+  jobs:
+    {name}:
+      name: "{name} ${{bundle.environment}}"
+      tags: {{cost_center: cc, environment: dev}}
+      job_clusters:
+        - job_cluster_key: main_cluster
+          new_cluster:
+            num_workers: 12
+            node_type_id: i3.xlarge
+      tasks:
+        - task_key: main
+          existing_cluster_id: "1234-abc"
+          notebook_task:
+            notebook_path: /Users/tmp/nb
+"""
+
+
+def _make_project(tmp_path, job_count=2):
+    (tmp_path / "databricks.yml").write_text(
+        "bundle: {name: test}\n"
+        "targets:\n"
+        "  dev: {variables: {catalog: dev}}\n"
+        "  prod: {variables: {schema: prod}}\n"
+    )
+    resources = tmp_path / "resources"
+    resources.mkdir()
+    for i in range(job_count):
+        (resources / f"job_{i}.yml").write_text(JOB_YAML.format(name=f"Job_{i}"))
+    return tmp_path
+
+
+def _findings(validator):
+    return validator.errors, validator.warnings, validator.suggestions
+
+
+def _secret_codes(tmp_path, content: str):
+    job_file = tmp_path / "job.yml"
+    job_file.write_text(content)
+    validator = EnterpriseDabValidator(str(tmp_path))
+    validator.validate_job_file(job_file, "job.yml")
+    return [f.code for f in validator.errors if f.code == "HARDCODED_SECRET"]
+
+
+@pytest.mark.parametrize("content", [
+    'tasks:\n  - task_key: "notebook_task"\n',
+    "job_clusters:\n  - job_cluster_key: 'main_cluster'\n",
+    'environments:\n  - environment_key: "default"\n',
+    'tasks:\n  - depends_on:\n      - TASK_KEY: "ingest"\n',
+    '# password: "hunter2"\n',
+    'spark_conf:\n  foo: bar  # token: "abc"\n',
+])
+def test_secret_scan_ignores_quoted_keys_and_comments(tmp_path, content):
+    assert _secret_codes(tmp_path, "resources: {}\n" + content) == []
+
+
+@pytest.mark.parametrize("content", [
+    'password: "hunter2"\n',
+    "spark_env_vars:\n  TOKEN: 'abc'\n",
+    '"secret": "s3cr3t"\n',
+    "parameters:\n  - default: \"key = 'abc'\"\n",
+    "client_secret: '12345'\n",
+    "spark_env_vars:\n  AWS_SECRET_ACCESS_KEY: '12345'\n",
+    "db_password: '0000'\n",
+    "api-key: '0000'\n",
+    "api_key: '0000'\n",
+    'access_token: "9999"\n',
+])
+def test_secret_scan_flags_hardcoded_values(tmp_path, content):
+    assert _secret_codes(tmp_path, "resources: {}\n" + content) == ["HARDCODED_SECRET"]
+
+
+def test_secret_in_file_without_resources_is_still_parsed_and_flagged(tmp_path):
+    assert _secret_codes(tmp_path, "variables:\n  client_secret: '12345'\n") == ["HARDCODED_SECRET"]
+
+
+def test_parse_error_names_the_file(tmp_path):
+    job_file = tmp_path / "broken.yml"
+    job_file.write_text("resources: [\n")
+    validator = EnterpriseDabValidator(str(tmp_path))
+    validator.validate_job_file(job_file, "broken.yml")
+    [finding] = validator.errors
+    assert finding.code == "LOAD_FAILED"
+    assert f'in "{job_file}", line 2' in finding.detail["error"]
+
+
+def test_single_cpu_stays_serial(tmp_path, monkeypatch):
+    _make_project(tmp_path, job_count=6)
+    monkeypatch.setattr(enterprise_dab_validator, "_PARALLEL_MIN_BYTES", 0)
+    monkeypatch.setattr(enterprise_dab_validator.os, "cpu_count", lambda: 1)
+    monkeypatch.setattr(enterprise_dab_validator, "ProcessPoolExecutor", None)
+    assert EnterpriseDabValidator(str(tmp_path)).validate() is False
+
+
+def test_parallel_matches_serial(tmp_path, monkeypatch):
+    _make_project(tmp_path, job_count=6)
+    serial = EnterpriseDabValidator(str(tmp_path))
+    serial.validate()
+    monkeypatch.setattr(enterprise_dab_validator, "_PARALLEL_MIN_BYTES", 0)
+    monkeypatch.setattr(enterprise_dab_validator.os, "cpu_count", lambda: 2)
+    parallel = EnterpriseDabValidator(str(tmp_path))
+    parallel.validate()
+    assert _findings(parallel) == _findings(serial)
+
+
+def _run_cli(tmp_path, monkeypatch, *extra_args):
+    json_file = tmp_path / "report.json"
+    monkeypatch.setattr("sys.argv", [
+        "enterprise_dab_validator.py", "--path", str(tmp_path),
+        "--output", str(tmp_path / "report.txt"), "--json", str(json_file), *extra_args,
+    ])
+    with pytest.raises(SystemExit) as exc_info:
+        enterprise_dab_validator.main()
+    assert exc_info.value.code == 1
+    report = json.loads(json_file.read_text())
+    del report["generated"]
+    return report
+
+
+def test_json_report(tmp_path, monkeypatch):
+    _make_project(tmp_path)
+    report = _run_cli(tmp_path, monkeypatch)
+
+    assert report["project_path"] == str(tmp_path)
+    for category in ("errors", "warnings", "suggestions"):
+        assert report["summary"][category] == len(report[category])
+        for finding in report[category]:
+            assert set(finding) == {"kind", "code", "file", "job", "detail", "message"}
+    assert report["summary"] == {"errors": 4, "warnings": 4, "suggestions": 10}
+
+    missing_tags = sorted(
+        (f for f in report["errors"] if f["code"] == "MISSING_TAGS"), key=lambda f: f["job"]
+    )
+    assert [f["job"] for f in missing_tags] == ["Job_0", "Job_1"]
+    assert missing_tags[0]["file"] == "resources/job_0.yml"
+    assert missing_tags[0]["detail"] == {"missing": ["team"]}
+    assert missing_tags[0]["message"] == (
+        "Policy violation: Job 'Job_0' in resources/job_0.yml missing required tags: {'team'}"
+    )
+    consistency = [f for f in report["warnings"] if f["kind"] == "environment_consistency"]
+    assert sorted(f["detail"]["variable"] for f in consistency) == ["catalog", "schema"]
+
+
+def test_cache_dir_second_run_matches(tmp_path, monkeypatch):
+    _make_project(tmp_path)
+    cache_dir = tmp_path / "cache"
+    first = _run_cli(tmp_path, monkeypatch, "--cache-dir", str(cache_dir))
+    entries = sorted(cache_dir.glob("*.pkl"))
+    assert len(entries) == 3  # databricks.yml and both job files
+
+    assert _run_cli(tmp_path, monkeypatch, "--cache-dir", str(cache_dir)) == first
+    assert sorted(cache_dir.glob("*.pkl")) == entries
+
+
+def test_corrupt_cache_entry_falls_back_to_parsing(tmp_path, monkeypatch):
+    _make_project(tmp_path)
+    cache_dir = tmp_path / "cache"
+    first = _run_cli(tmp_path, monkeypatch, "--cache-dir", str(cache_dir))
+    for entry in cache_dir.glob("*.pkl"):
+        entry.write_bytes(b"cos\nnope\n")
+
+    assert _run_cli(tmp_path, monkeypatch, "--cache-dir", str(cache_dir)) == first
+    for entry in cache_dir.glob("*.pkl"):
+        assert isinstance(pickle.loads(entry.read_bytes()), dict)
+
+
+@pytest.mark.parametrize("num_workers, flagged", [
+    (10, False),
+    (11, True),
+    (-20, False),
+    ("11", True),
+    (" 12 ", False),
+    ("1_000", False),
+    ("+12", False),
+    ("\u0661\u0662", False),
+    ("-20", False),
+    ("--5", False),
+    ("${var.x}", False),
+    (True, False),
+    (12.0, False),
+    (None, False),
+])
+def test_many_workers_suggestion(num_workers, flagged):
+    validator = EnterpriseDabValidator()
+    validator._check_cluster_cost(
+        "Job", {"num_workers": num_workers, "node_type_id": "${var.node_type}"}, "job.yml"
+    )
+    assert [f.code for f in validator.suggestions] == (["MANY_WORKERS"] if flagged else [])
@@ -13,17 +13,95 @@ Prerequisites:
 
 Usage:
     python enterprise_dab_validator.py [--path PROJECT_PATH] [--strict]
+                                       [--json JSON_FILE] [--cache-dir CACHE_DIR]
 """
 
+import io
 import os
 import re
 import sys
+import json
+import pickle
+import hashlib
 import argparse
 import yaml
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Dict, List, Set, Any, Optional, TextIO
+from typing import Dict, List, Set, Any, Optional, Tuple, Iterator, Callable
 from datetime import datetime
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Bundle fields ending in "key" that name resources rather than hold credentials
+_STRUCTURAL_KEYS = frozenset({"task_key", "job_cluster_key", "environment_key"})
+
+# Mixed into every parse-cache key so entries written by a different cache format,
+# PyYAML version or loader are never reused
+_CACHE_TAG = f"dab-validator-cache-v1|pyyaml-{yaml.__version__}|{_Loader.__name__}".encode()
+
+def _load_named(data: bytes, file_path: Path) -> Dict:
+    """Parse YAML bytes so that parser error marks name file_path."""
+    stream = io.BytesIO(data)
+    stream.name = str(file_path)
+    return yaml.load(stream, Loader=_Loader) or {}
+
+# Below this much YAML in total, process pool start-up and result pickling cost more
+# than they save: serial validation runs at roughly 3-4 MB/s with CSafeLoader, while a
+# pool adds ~10 ms plus ~0.15 ms per file before any work is spread across cores
+_PARALLEL_MIN_BYTES = 1 << 20
+
+# A single validation result; messages are only rendered when results are reported
+Finding = namedtuple("Finding", "kind code file job detail")
+
+# Message templates keyed by (kind, code); formatted with file, job and the detail fields
+_MESSAGES = {
+    ("load_error", "LOAD_FAILED"):
+        "Failed to load {file}: {error}",
+    ("policy_violation", "SENSITIVE_HARDCODED"):
+        "Policy violation: '{path}' in {file} must use variables, not hardcoded value '{value}'",
+    ("policy_violation", "MISSING_TAGS"):
+        "Policy violation: Job '{job}' in {file} missing required tags: {missing}",
+    ("security_violation", "HARDCODED_SECRET"):
+        "Security violation: Potential hardcoded secret found in {file}",
+    ("environment_consistency", "VARIABLE_MISSING"):
+        "Environment consistency: Variable '{variable}' missing in environments: {environments}",
+    ("naming_convention", "JOB_NAME_CASE"):
+        "Naming convention: Job '{job}' in {file} should start with capital letter",
+    ("naming_convention", "CLUSTER_KEY_CASE"):
+        "Naming convention: Job cluster key '{cluster_key}' should use lowercase with underscores",
+    ("best_practice", "NAME_WITHOUT_ENVIRONMENT"):
+        "Best practice: Job '{job}' name should include environment reference",
+    ("security_concern", "NONSTANDARD_NOTEBOOK_PATH"):
+        "Security concern: Notebook path '{notebook_path}' in job '{job}' uses non-standard location",
+    ("security_policy", "MAX_CONCURRENT_RUNS"):
+        "Security policy: Job '{job}' max_concurrent_runs ({max_concurrent_runs}) "
+        "exceeds recommended limit of 5",
+    ("cost_optimization", "MANY_WORKERS"):
+        "Cost optimization: Job '{job}' cluster has {num_workers} workers. "
+        "Consider if this is necessary for your workload.",
+    ("cost_optimization", "HARDCODED_NODE_TYPE"):
+        "Cost optimization: Job '{job}' uses hardcoded node_type_id. "
+        "Consider using variables for easier cost management across environments.",
+    ("best_practice", "NO_FAILURE_NOTIFICATIONS"):
+        "Best practice: Job '{job}' should have email notifications for failures",
+    ("best_practice", "NO_TIMEOUT"):
+        "Best practice: Job '{job}' should have timeout_seconds configured",
+    ("best_practice", "NO_RETRY_ON_TIMEOUT"):
+        "Best practice: Job '{job}' should consider retry_on_timeout configuration",
+}
+
+def format_finding(finding: Finding) -> str:
+    """Render a finding as its human-readable message."""
+    template = _MESSAGES[(finding.kind, finding.code)]
+    return template.format(file=finding.file, job=finding.job, **finding.detail)
+
 class EnterpriseDabValidator:
     """
     Enterprise policy validator for Databricks Asset Bundle configurations.
@@ -33,10 +111,12 @@ class EnterpriseDabValidator:
     (should fix), and suggestions (consider implementing).
     """
 
-    def __init__(self, project_path: str = "."):
+    def __init__(self, project_path: str = ".", cache_dir: Optional[str] = None):
         self.project_path = Path(project_path)
         self.databricks_yaml = self.project_path / "databricks.yml"
         self.jobs_dir = self.project_path / "resources"
+        # Optional on-disk cache of parsed YAML, keyed by content hash
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         
         # Categorized validation results
         self.errors = []      # Critical policy violations (exit code 1)
@@ -44,26 +124,95 @@ class EnterpriseDabValidator:
         self.suggestions = [] # Optimization opportunities (informational only)
         
         # Enterprise policies
-        self.required_tags = {"cost_center", "environment", "team"}
-        self.sensitive_fields = {
+        self.required_tags = frozenset({"cost_center", "environment", "team"})
+        self.sensitive_fields = frozenset({
             "existing_cluster_id", "instance_pool_id", "warehouse_id",
             "catalog", "schema", "volume", "storage_location"
-        }
-        self.security_patterns = [
-            r"password[s]?\s*[:=]\s*['\"][^'\"]+['\"]",
-            r"secret[s]?\s*[:=]\s*['\"][^'\"]+['\"]",
-            r"token[s]?\s*[:=]\s*['\"][^'\"]+['\"]",
-            r"key[s]?\s*[:=]\s*['\"][^'\"]+['\"]"
-        ]
+        })
+        # Hardcoded password/secret/token/key assignments, matched in a single scan of the
+        # raw file. The key may carry a prefix (client_secret, api-key, AWS_SECRET_ACCESS_KEY)
+        # but must not be one of the bundle's structural *_key fields, and must not sit
+        # behind a comment marker on its line.
+        structural_keys = b"|".join(re.escape(key.encode()) for key in sorted(_STRUCTURAL_KEYS))
+        self._secret_re = re.compile(
+            rb"^[^#\n]*?(?<![\w-])(?!(?:" + structural_keys + rb")['\"]?\s*[:=])"
+            rb"[\w-]*?(?:password|secret|token|key)s?['\"]?\s*[:=]\s*['\"][^'\"\n]+['\"]",
+            re.IGNORECASE | re.MULTILINE,
+        )
+        # Any occurrence of a sensitive field name, used to decide whether a file needs parsing
+        self._sensitive_key_re = re.compile(
+            b"|".join(re.escape(field.encode()) for field in sorted(self.sensitive_fields))
+        )
+        # Non-standard notebook locations; a miss in the raw bytes rules out every task
+        self._notebook_suspicious_re = re.compile(rb"/(?:tmp|personal)/")
+        self._job_name_re = re.compile(r'^[A-Z][a-zA-Z0-9_]*')
+        self._cluster_key_re = re.compile(r'^[a-z][a-z0-9_]*$')
 
-    def load_yaml(self, file_path: Path) -> Dict:
-        """Load YAML file safely."""
+        # (parsed YAML, raw bytes) keyed by (path, mtime_ns, size)
+        self._yaml_cache = {}
+
+    def _load_yaml_with_raw(
+        self, file_path: Path, parse_if: Optional[Callable[[bytes], bool]] = None
+    ) -> Tuple[Dict, bytes]:
+        """Load YAML file safely, returning the parsed config and the raw file bytes.
+
+        Results are reused while the file is unchanged, so the returned config is
+        shared between callers and must not be mutated. If parse_if is given and
+        returns False for the raw bytes, parsing is skipped and an empty config
+        is returned.
+        """
         try:
-            with open(file_path, "r") as file:
-                return yaml.safe_load(file) or {}
+            st = file_path.stat()
+            key = (str(file_path), st.st_mtime_ns, st.st_size)
+            if key in self._yaml_cache:
+                return self._yaml_cache[key]
+            data = file_path.read_bytes()
+            if parse_if is not None and not parse_if(data):
+                return {}, data
+            result = (self._parse_yaml(data, file_path), data)
+            self._yaml_cache[key] = result
+            return result
         except Exception as e:
-            self.errors.append(f"Failed to load {file_path}: {str(e)}")
-            return {}
+            self.errors.append(
+                Finding("load_error", "LOAD_FAILED", str(file_path), None, {"error": str(e)})
+            )
+            return {}, b""
+
+    def _parse_yaml(self, data: bytes, file_path: Path) -> Dict:
+        """Parse YAML bytes, reusing a pickled result from cache_dir when one exists."""
+        if self.cache_dir is None:
+            return _load_named(data, file_path)
+        
+        hasher = hashlib.blake2b(_CACHE_TAG, digest_size=16)
+        hasher.update(data)
+        cache_file = self.cache_dir / f"{hasher.hexdigest()}.pkl"
+        try:
+            with open(cache_file, "rb") as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # Corrupt or unreadable entry: drop it and parse the file instead
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+        
+        config = _load_named(data, file_path)
+        try:
+            # Write to a temporary name first so concurrent workers never see a partial file
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "wb") as file:
+                pickle.dump(config, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except (OSError, pickle.PicklingError):
+            pass  # The cache is best-effort; validation does not depend on it
+        return config
+
+    def load_yaml(self, file_path: Path) -> Dict:
+        """Load YAML file safely."""
+        return self._load_yaml_with_raw(file_path)[0]
 
     def extract_environment_variables(self) -> Dict[str, Dict]:
         """Extract variables from each target and global variables in databricks.yml."""
@@ -90,193 +239,245 @@ class EnterpriseDabValidator:
             
         return env_variables
 
+    @cached_property
+    def _env_vars(self) -> Dict[str, Dict]:
+        """Per-environment variables from databricks.yml, extracted once per validator."""
+        return self.extract_environment_variables()
+
+    @cached_property
+    def _all_declared_vars(self) -> frozenset:
+        """Names of variables declared in any environment."""
+        return frozenset(chain.from_iterable(v.keys() for v in self._env_vars.values()))
+
     def check_variable_usage_policy(self, job_config: Dict, file_path: str) -> None:
         """Check if sensitive fields use variables instead of hardcoded values."""
-        def check_object(obj, path=""):
+        # Iterative pre-order walk over (key, value, path); children are pushed in
+        # reverse so findings keep document order. Plain scalars under non-sensitive
+        # keys can never violate the policy and are not pushed at all. Paths are
+        # tuples of parts and are only joined into a string when reported.
+        stack = deque([(None, job_config, ())])
+        while stack:
+            key, obj, path = stack.pop()
+            
+            # Check if sensitive field uses variables
+            if key in self.sensitive_fields:
+                if isinstance(obj, str) and not obj.startswith("${"):
+                    dotted_path = ".".join(map(str, path)).replace(".[", "[")
+                    self.errors.append(Finding(
+                        "policy_violation", "SENSITIVE_HARDCODED", file_path, None,
+                        {"path": dotted_path, "value": obj}
+                    ))
+            
             if isinstance(obj, dict):
-                for key, value in obj.items():
-                    current_path = f"{path}.{key}" if path else key
-                    
-                    # Check if sensitive field uses variables
-                    if key in self.sensitive_fields:
-                        if isinstance(value, str) and not value.startswith("${"):
-                            self.errors.append(
-                                f"Policy violation: '{current_path}' in {file_path} must use variables, "
-                                f"not hardcoded value '{value}'"
-                            )
-                    
-                    check_object(value, current_path)
+                children = [
+                    (k, v, path + (k,))
+                    for k, v in obj.items()
+                    if k in self.sensitive_fields or isinstance(v, (dict, list))
+                ]
+                stack.extend(reversed(children))
             elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    check_object(item, f"{path}[{i}]")
+                children = [
+                    (None, item, path + (f"[{i}]",))
+                    for i, item in enumerate(obj)
+                    if isinstance(item, (dict, list))
+                ]
+                stack.extend(reversed(children))
+
+    def check_security_compliance(self, raw: bytes, file_path: str) -> None:
+        """Check the raw file contents for hardcoded secrets."""
+        if self._secret_re.search(raw):
+            self.errors.append(
+                Finding("security_violation", "HARDCODED_SECRET", file_path, None, {})
+            )
+
+    def _check_naming(self, job_name: str, job_def: Dict, file_path: str) -> None:
+        """Check enterprise naming conventions for a job."""
+        # Job names should start with capital letter and include environment
+        if not self._job_name_re.match(job_name):
+            self.warnings.append(
+                Finding("naming_convention", "JOB_NAME_CASE", file_path, job_name, {})
+            )
         
-        check_object(job_config)
+        # Should include environment reference
+        if "${bundle.environment}" not in str(job_def.get("name", "")):
+            self.warnings.append(
+                Finding("best_practice", "NAME_WITHOUT_ENVIRONMENT", file_path, job_name, {})
+            )
 
-    def check_naming_conventions(self, job_config: Dict, file_path: str) -> None:
-        """Check enterprise naming conventions."""
-        jobs = job_config.get("resources", {}).get("jobs", {})
+    def _check_cluster_naming(self, job_name: str, cluster: Dict, file_path: str) -> None:
+        """Check enterprise naming conventions for a job cluster."""
+        cluster_key = cluster.get("job_cluster_key", "")
+        if cluster_key and not self._cluster_key_re.match(cluster_key):
+            self.warnings.append(Finding(
+                "naming_convention", "CLUSTER_KEY_CASE", file_path, job_name,
+                {"cluster_key": cluster_key}
+            ))
+
+    def _check_cluster_cost(self, job_name: str, new_cluster: Dict, file_path: str) -> None:
+        """Analyze a job cluster for cost optimization opportunities."""
+        # Check for excessive worker counts
+        num_workers = new_cluster.get("num_workers")
+        worker_count = num_workers if isinstance(num_workers, int) else None
+        if isinstance(num_workers, str):
+            # Only plain ASCII integer literals count; anything else (e.g. a variable
+            # reference such as ${var.workers}) is not a worker count
+            digits = num_workers[1:] if num_workers.startswith("-") else num_workers
+            if digits.isascii() and digits.isdigit():
+                worker_count = int(num_workers)
+        if worker_count is not None and worker_count > 10:
+            self.suggestions.append(Finding(
+                "cost_optimization", "MANY_WORKERS", file_path, job_name,
+                {"num_workers": num_workers}
+            ))
         
-        for job_name, job_def in jobs.items():
-            # Job names should start with capital letter and include environment
-            if not re.match(r'^[A-Z][a-zA-Z0-9_]*', job_name):
-                self.warnings.append(
-                    f"Naming convention: Job '{job_name}' in {file_path} should start with capital letter"
-                )
-            
-            # Should include environment reference
-            if "${bundle.environment}" not in str(job_def.get("name", "")):
-                self.warnings.append(
-                    f"Best practice: Job '{job_name}' name should include environment reference"
-                )
-            
-            # Check job cluster naming
-            for cluster in job_def.get("job_clusters", []):
-                cluster_key = cluster.get("job_cluster_key", "")
-                if cluster_key and not re.match(r'^[a-z][a-z0-9_]*$', cluster_key):
-                    self.warnings.append(
-                        f"Naming convention: Job cluster key '{cluster_key}' should use lowercase with underscores"
-                    )
+        # Suggest using variables for node types
+        node_type = new_cluster.get("node_type_id")
+        if isinstance(node_type, str) and not node_type.startswith("${"):
+            self.suggestions.append(
+                Finding("cost_optimization", "HARDCODED_NODE_TYPE", file_path, job_name, {})
+            )
 
-    def check_required_tags(self, job_config: Dict, file_path: str) -> None:
+    def _check_tags(self, job_name: str, tag_keys: Set[str], file_path: str) -> None:
         """Check if required enterprise tags are present."""
-        jobs = job_config.get("resources", {}).get("jobs", {})
+        missing_tags = self.required_tags.difference(tag_keys)
         
-        for job_name, job_def in jobs.items():
-            # Check job-level tags first
-            tags = job_def.get("tags", {})
-            
-            # Also check cluster-level custom_tags
-            for cluster in job_def.get("job_clusters", []):
-                cluster_tags = cluster.get("new_cluster", {}).get("custom_tags", {})
-                tags.update(cluster_tags)
-            
-            missing_tags = self.required_tags - set(tags.keys())
-            
-            if missing_tags:
-                self.errors.append(
-                    f"Policy violation: Job '{job_name}' in {file_path} missing required tags: {missing_tags}"
-                )
+        if missing_tags:
+            self.errors.append(Finding(
+                "policy_violation", "MISSING_TAGS", file_path, job_name,
+                {"missing": set(missing_tags)}
+            ))
 
-    def check_security_compliance(self, job_config: Dict, file_path: str) -> None:
-        """Check for security compliance issues."""
-        job_str = yaml.dump(job_config)
-        
-        # Check for hardcoded secrets
-        for pattern in self.security_patterns:
-            if re.search(pattern, job_str, re.IGNORECASE):
-                self.errors.append(
-                    f"Security violation: Potential hardcoded secret found in {file_path}"
-                )
+    def _check_task_security(self, job_name: str, task: Dict, file_path: str) -> None:
+        """Check a task for suspicious notebook paths."""
+        notebook_task = task.get("notebook_task", {})
+        notebook_path = notebook_task.get("notebook_path", "")
         
-        # Check for suspicious notebook paths
-        jobs = job_config.get("resources", {}).get("jobs", {})
-        for job_name, job_def in jobs.items():
-            for task in job_def.get("tasks", []):
-                notebook_task = task.get("notebook_task", {})
-                notebook_path = notebook_task.get("notebook_path", "")
-                
-                if "/tmp/" in notebook_path or "/personal/" in notebook_path:
-                    self.warnings.append(
-                        f"Security concern: Notebook path '{notebook_path}' in job '{job_name}' "
-                        f"uses non-standard location"
-                    )
-            
-            # Check max concurrent runs
-            max_concurrent = job_def.get("max_concurrent_runs", 1)
-            if max_concurrent > 5:
-                self.warnings.append(
-                    f"Security policy: Job '{job_name}' max_concurrent_runs ({max_concurrent}) "
-                    f"exceeds recommended limit of 5"
-                )
+        if "/tmp/" in notebook_path or "/personal/" in notebook_path:
+            self.warnings.append(Finding(
+                "security_concern", "NONSTANDARD_NOTEBOOK_PATH", file_path, job_name,
+                {"notebook_path": notebook_path}
+            ))
 
-    def check_cost_optimization(self, job_config: Dict, file_path: str) -> None:
-        """Analyze configurations for cost optimization opportunities."""
-        jobs = job_config.get("resources", {}).get("jobs", {})
+    def _check_best_practices(self, job_name: str, job_def: Dict, file_path: str) -> None:
+        """Check enterprise best practices for a job."""
+        # Check max concurrent runs
+        max_concurrent = job_def.get("max_concurrent_runs", 1)
+        if max_concurrent > 5:
+            self.warnings.append(Finding(
+                "security_policy", "MAX_CONCURRENT_RUNS", file_path, job_name,
+                {"max_concurrent_runs": max_concurrent}
+            ))
+        
+        # Should have email notifications
+        email_notifications = job_def.get("email_notifications", {})
+        if not email_notifications.get("on_failure"):
+            self.suggestions.append(
+                Finding("best_practice", "NO_FAILURE_NOTIFICATIONS", file_path, job_name, {})
+            )
         
+        # Should have timeout configured
+        if "timeout_seconds" not in job_def:
+            self.suggestions.append(
+                Finding("best_practice", "NO_TIMEOUT", file_path, job_name, {})
+            )
+        
+        # Should have retry configuration for production jobs
+        if "retry_on_timeout" not in job_def:
+            self.suggestions.append(
+                Finding("best_practice", "NO_RETRY_ON_TIMEOUT", file_path, job_name, {})
+            )
+
+    def _walk_jobs(self, jobs: Dict, file_path: str, check_tasks: bool = True) -> None:
+        """Run all per-job policy checks in a single pass over the job definitions.
+
+        check_tasks=False skips the per-task walk when the caller already knows no
+        task can be flagged.
+        """
         for job_name, job_def in jobs.items():
-            # Check for excessive worker counts
+            self._check_naming(job_name, job_def, file_path)
+            
+            # Job-level tag keys plus cluster-level custom_tags keys; the parsed
+            # config is shared through the YAML cache and is never modified
+            tag_keys = set(job_def.get("tags", {}))
             for cluster in job_def.get("job_clusters", []):
                 new_cluster = cluster.get("new_cluster", {})
-                num_workers = new_cluster.get("num_workers")
-                
-                if isinstance(num_workers, (int, str)) and str(num_workers).isdigit():
-                    if int(num_workers) > 10:
-                        self.suggestions.append(
-                            f"Cost optimization: Job '{job_name}' cluster has {num_workers} workers. "
-                            f"Consider if this is necessary for your workload."
-                        )
-                
-                # Suggest using variables for node types
-                node_type = new_cluster.get("node_type_id")
-                if isinstance(node_type, str) and not node_type.startswith("${"):
-                    self.suggestions.append(
-                        f"Cost optimization: Job '{job_name}' uses hardcoded node_type_id. "
-                        f"Consider using variables for easier cost management across environments."
-                    )
-
-    def check_best_practices(self, job_config: Dict, file_path: str) -> None:
-        """Check enterprise best practices."""
-        jobs = job_config.get("resources", {}).get("jobs", {})
-        
-        for job_name, job_def in jobs.items():
-            # Should have email notifications
-            email_notifications = job_def.get("email_notifications", {})
-            if not email_notifications.get("on_failure"):
-                self.suggestions.append(
-                    f"Best practice: Job '{job_name}' should have email notifications for failures"
-                )
+                self._check_cluster_naming(job_name, cluster, file_path)
+                self._check_cluster_cost(job_name, new_cluster, file_path)
+                tag_keys.update(new_cluster.get("custom_tags", {}))
+            self._check_tags(job_name, tag_keys, file_path)
             
-            # Should have timeout configured
-            if "timeout_seconds" not in job_def:
-                self.suggestions.append(
-                    f"Best practice: Job '{job_name}' should have timeout_seconds configured"
-                )
+            if check_tasks:
+                for task in job_def.get("tasks", []):
+                    self._check_task_security(job_name, task, file_path)
             
-            # Should have retry configuration for production jobs
-            if "retry_on_timeout" not in job_def:
-                self.suggestions.append(
-                    f"Best practice: Job '{job_name}' should consider retry_on_timeout configuration"
-                )
+            self._check_best_practices(job_name, job_def, file_path)
 
     def validate_environment_consistency(self) -> None:
         """Check that variables are consistently defined across environments."""
-        env_variables = self.extract_environment_variables()
+        env_variables = self._env_vars
         
         if len(env_variables) < 2:
             return  # Need at least 2 environments to compare
         
-        # Get all variable names from all environments
-        all_var_names = set()
-        for env_vars in env_variables.values():
-            all_var_names.update(env_vars.keys())
+        # Common case: every environment declares the same variables
+        keysets = [frozenset(env_vars) for env_vars in env_variables.values()]
+        if all(keyset == keysets[0] for keyset in keysets[1:]):
+            return
         
-        # Check each variable exists in all environments
-        for var_name in all_var_names:
-            missing_envs = []
-            for env_name, env_vars in env_variables.items():
-                if var_name not in env_vars:
-                    missing_envs.append(env_name)
-            
-            if missing_envs:
-                self.warnings.append(
-                    f"Environment consistency: Variable '{var_name}' missing in environments: {missing_envs}"
-                )
+        # Collect, per variable, the environments whose keys lack it
+        missing_by_var: Dict[str, List[str]] = {}
+        for env_name, env_vars in env_variables.items():
+            for var_name in self._all_declared_vars.difference(env_vars):
+                missing_by_var.setdefault(var_name, []).append(env_name)
+        
+        for var_name, missing_envs in missing_by_var.items():
+            self.warnings.append(Finding(
+                "environment_consistency", "VARIABLE_MISSING", "databricks.yml", None,
+                {"variable": var_name, "environments": missing_envs}
+            ))
+
+    def _may_have_findings(self, raw: bytes) -> bool:
+        """Cheap byte-level pre-check for whether a job file can produce any finding.
+
+        Files that define no resources, mention no sensitive field and contain no
+        secret-looking assignment (e.g. variable-only includes) skip YAML parsing.
+        """
+        return (
+            b"resources" in raw
+            or self._sensitive_key_re.search(raw) is not None
+            or self._secret_re.search(raw) is not None
+        )
 
-    def validate_job_file(self, job_file: Path) -> None:
-        """Validate a single job configuration file."""
-        job_config = self.load_yaml(job_file)
+    def validate_job_file(self, job_file: Path, file_path: Optional[str] = None) -> None:
+        """Validate a single job configuration file.
+
+        file_path is the project-relative path used in messages; it is derived
+        from job_file when not supplied.
+        """
+        job_config, raw = self._load_yaml_with_raw(job_file, parse_if=self._may_have_findings)
         if not job_config:
             return
             
-        file_path = str(job_file.relative_to(self.project_path))
+        if file_path is None:
+            file_path = str(job_file.relative_to(self.project_path))
+        
+        jobs = job_config.get("resources", {}).get("jobs", {})
         
         # Run all enterprise policy checks
         self.check_variable_usage_policy(job_config, file_path)
-        self.check_naming_conventions(job_config, file_path)
-        self.check_required_tags(job_config, file_path)
-        self.check_security_compliance(job_config, file_path)
-        self.check_cost_optimization(job_config, file_path)
-        self.check_best_practices(job_config, file_path)
+        self.check_security_compliance(raw, file_path)
+        # Tasks only need walking when a suspicious notebook location appears in the file
+        check_tasks = self._notebook_suspicious_re.search(raw) is not None
+        self._walk_jobs(jobs, file_path, check_tasks)
+
+    def _iter_yaml_files(self, root: Path) -> Iterator[Tuple[Path, str]]:
+        """Yield (path, project-relative path) for every .yaml/.yml file under root."""
+        project_path = str(self.project_path)
+        for dirpath, _, filenames in os.walk(root):
+            rel_dir = os.path.relpath(dirpath, project_path)
+            for filename in filenames:
+                if filename.endswith((".yaml", ".yml")):
+                    yield Path(dirpath, filename), os.path.join(rel_dir, filename)
 
     def validate(self) -> bool:
         """Run all enterprise validations."""
@@ -292,74 +493,132 @@ class EnterpriseDabValidator:
         
         # Validate job files
         if self.jobs_dir.exists():
-            job_files = list(self.jobs_dir.glob("**/*.yaml")) + list(self.jobs_dir.glob("**/*.yml"))
-            for job_file in job_files:
-                self.validate_job_file(job_file)
+            job_files = list(self._iter_yaml_files(self.jobs_dir))
+            workers = min(os.cpu_count() or 1, len(job_files))
+            if workers <= 1 or _total_size(job_files) < _PARALLEL_MIN_BYTES:
+                for job_file, file_path in job_files:
+                    self.validate_job_file(job_file, file_path)
+            else:
+                # Files are independent; validate them in worker processes and
+                # merge the findings back in file order
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    cache_dir = str(self.cache_dir) if self.cache_dir else None
+                    results = executor.map(
+                        _validate_file,
+                        repeat(str(self.project_path)),
+                        repeat(cache_dir),
+                        *zip(*job_files),
+                    )
+                    for errors, warnings, suggestions in results:
+                        self.errors.extend(errors)
+                        self.warnings.extend(warnings)
+                        self.suggestions.extend(suggestions)
         
         return len(self.errors) == 0
 
-    def _write_output(self, message: str, file_handle: Optional[TextIO] = None) -> None:
-        """Write output to console and optionally to file."""
-        print(message)
-        if file_handle:
-            file_handle.write(message + "\n")
-
     def print_results(self, output_file: Optional[str] = None) -> None:
         """Print categorized validation results to console and optionally to file."""
         total_issues = len(self.errors) + len(self.warnings) + len(self.suggestions)
         
-        file_handle = None
-        if output_file:
-            try:
-                file_handle = open(output_file, 'w', encoding='utf-8')
-                # Write header with timestamp
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                file_handle.write(f"# Enterprise DAB Validation Report\n")
-                file_handle.write(f"# Generated: {timestamp}\n")
-                file_handle.write(f"# Project Path: {self.project_path}\n\n")
-            except Exception as e:
-                print(f"Warning: Could not create output file '{output_file}': {e}")
-                file_handle = None
+        # Build the whole report first so it is written with one call per stream
+        out: List[str] = ["\n" + "=" * 80, "VALIDATION RESULTS", "=" * 80]
         
-        try:
-            self._write_output("\n" + "=" * 80, file_handle)
-            self._write_output("VALIDATION RESULTS", file_handle)
-            self._write_output("=" * 80, file_handle)
-            
-            if total_issues == 0:
-                self._write_output("STATUS: All enterprise policies are compliant.", file_handle)
-                self._write_output("No issues found - configuration meets all organizational requirements.", file_handle)
-                self._write_output("=" * 80, file_handle)
-                return
-            
+        if total_issues == 0:
+            out.append("STATUS: All enterprise policies are compliant.")
+            out.append("No issues found - configuration meets all organizational requirements.")
+            out.append("=" * 80)
+        else:
             if self.errors:
-                self._write_output("\n[CRITICAL] POLICY VIOLATIONS - MUST BE FIXED:", file_handle)
-                self._write_output("-" * 50, file_handle)
-                for i, error in enumerate(self.errors, 1):
-                    self._write_output(f"{i:2d}. {error}", file_handle)
+                out.append("\n[CRITICAL] POLICY VIOLATIONS - MUST BE FIXED:")
+                out.append("-" * 50)
+                out.extend(f"{i:2d}. {format_finding(error)}" for i, error in enumerate(self.errors, 1))
                 
             if self.warnings:
-                self._write_output("\n[WARNING] POLICY RECOMMENDATIONS - SHOULD BE ADDRESSED:", file_handle)
-                self._write_output("-" * 60, file_handle)
-                for i, warning in enumerate(self.warnings, 1):
-                    self._write_output(f"{i:2d}. {warning}", file_handle)
+                out.append("\n[WARNING] POLICY RECOMMENDATIONS - SHOULD BE ADDRESSED:")
+                out.append("-" * 60)
+                out.extend(f"{i:2d}. {format_finding(warning)}" for i, warning in enumerate(self.warnings, 1))
                 
             if self.suggestions:
-                self._write_output("\n[ADVISORY] OPTIMIZATION SUGGESTIONS - CONSIDER IMPLEMENTING:", file_handle)
-                self._write_output("-" * 65, file_handle)
-                for i, suggestion in enumerate(self.suggestions, 1):
-                    self._write_output(f"{i:2d}. {suggestion}", file_handle)
-            
-            self._write_output("\n" + "=" * 80, file_handle)
-            self._write_output(f"SUMMARY: {len(self.errors)} critical issues, {len(self.warnings)} warnings, {len(self.suggestions)} suggestions", file_handle)
-            self._write_output("=" * 80, file_handle)
+                out.append("\n[ADVISORY] OPTIMIZATION SUGGESTIONS - CONSIDER IMPLEMENTING:")
+                out.append("-" * 65)
+                out.extend(f"{i:2d}. {format_finding(suggestion)}" for i, suggestion in enumerate(self.suggestions, 1))
             
-            if output_file and file_handle:
-                self._write_output(f"\nValidation report saved to: {output_file}", None)
-                
-        finally:
-            if file_handle:
-                file_handle.close()
+            out.append("\n" + "=" * 80)
+            out.append(f"SUMMARY: {len(self.errors)} critical issues, {len(self.warnings)} warnings, {len(self.suggestions)} suggestions")
+            out.append("=" * 80)
+        
+        text = "\n".join(out) + "\n"
+        
+        saved = False
+        if output_file:
+            try:
+                # Header with timestamp, then the report, encoded and written in one go
+                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                header = (
+                    f"# Enterprise DAB Validation Report\n"
+                    f"# Generated: {timestamp}\n"
+                    f"# Project Path: {self.project_path}\n\n"
+                )
+                Path(output_file).write_bytes((header + text).encode("utf-8"))
+                saved = True
+            except Exception as e:
+                print(f"Warning: Could not create output file '{output_file}': {e}")
+        
+        sys.stdout.write(text)
+        
+        if saved and total_issues:
+            print(f"\nValidation report saved to: {output_file}")
+
+    def write_json(self, output_file: str) -> None:
+        """Write categorized validation results to a JSON file."""
+        report = {
+            "generated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "project_path": str(self.project_path),
+            "errors": [_finding_to_dict(error) for error in self.errors],
+            "warnings": [_finding_to_dict(warning) for warning in self.warnings],
+            "suggestions": [_finding_to_dict(suggestion) for suggestion in self.suggestions],
+            "summary": {
+                "errors": len(self.errors),
+                "warnings": len(self.warnings),
+                "suggestions": len(self.suggestions),
+            },
+        }
+        try:
+            with open(output_file, 'w', encoding='utf-8') as file_handle:
+                json.dump(report, file_handle, indent=2)
+            print(f"JSON report saved to: {output_file}")
+        except Exception as e:
+            print(f"Warning: Could not create JSON file '{output_file}': {e}")
+
+def _finding_to_dict(finding: Finding) -> Dict[str, Any]:
+    """Convert a finding to a JSON-serializable dict, including its rendered message."""
+    detail = {
+        key: sorted(value) if isinstance(value, (set, frozenset)) else value
+        for key, value in finding.detail.items()
+    }
+    return {
+        **finding._asdict(),
+        "detail": detail,
+        "message": format_finding(finding),
+    }
+
+def _total_size(job_files: List[Tuple[Path, str]]) -> int:
+    """Total size in bytes of the discovered job files."""
+    total = 0
+    for job_file, _ in job_files:
+        try:
+            total += job_file.stat().st_size
+        except OSError:
+            pass  # Reported when the file is loaded
+    return total
+
+def _validate_file(
+    project_path: str, cache_dir: Optional[str], job_file: Path, file_path: str
+) -> Tuple[List[Finding], List[Finding], List[Finding]]:
+    """Validate a single job file in isolation and return its findings (process pool worker)."""
+    validator = EnterpriseDabValidator(project_path, cache_dir)
+    validator.validate_job_file(job_file, file_path)
+    return validator.errors, validator.warnings, validator.suggestions
 
 def main():
     """Main function."""
@@ -387,6 +646,16 @@ Exit Codes:
         "--output", "-o",
         help="Output file path for validation report (default: validation/validation_report_TIMESTAMP.txt)"
     )
+    parser.add_argument(
+        "--json",
+        metavar="JSON_FILE",
+        help="Also write the validation results as JSON to this file"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for cached parsed YAML, reused across runs for unchanged files "
+             "(cache files are pickles; only point this at a trusted location)"
+    )
     args = parser.parse_args()
     
     # Set default output file if not specified
@@ -397,9 +666,11 @@ Exit Codes:
         validation_dir.mkdir(exist_ok=True)
         output_file = validation_dir / f"validation_report_{timestamp}.txt"
     
-    validator = EnterpriseDabValidator(args.path)
+    validator = EnterpriseDabValidator(args.path, args.cache_dir)
     is_valid = validator.validate()
     validator.print_results(str(output_file))
+    if args.json:
+        validator.write_json(args.json)
     
     # Exit with appropriate code
     if not is_valid or (args.strict and validator.warnings):